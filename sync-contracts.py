@@ -7,15 +7,53 @@ This script syncs contract typechains and deployment configuration between:
 - frontend/ (React app)
 
 Usage: python sync-contracts.py
+
+The detailed summary is only printed when stdout is a terminal; set
+SYNC_VERBOSE=1 to print it when output is redirected.
 """
 
+import ctypes
+import errno
+import hashlib
 import json
+import os
 import shutil
+import subprocess
 import sys
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Union
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+try:
+    import orjson  # Optional: faster JSON parsing
+except ImportError:
+    orjson = None
+
+# Placeholder address used in contracts.json for contracts/tokens that are not deployed
+ZERO_ADDR = "0x0000000000000000000000000000000000000000"
+
+# Bump whenever the generated contracts-data.ts format changes so cached source hashes are invalidated
+DATA_TS_FORMAT_VERSION = "3"
+
+# Quoted object keys (at the start of a line in indented JSON) that are valid unquoted in TS
+_IDENT_KEY_RE = re.compile(r'^(\s*)"([A-Za-z_$][A-Za-z0-9_$]*|\d+)":', re.MULTILINE)
+
+# String values of (already unquoted) "type" keys, which are narrowed with "as const"
+_TYPE_CONST_RE = re.compile(r'^(\s*type: "(?:[^"\\]|\\.)*")', re.MULTILINE)
+
+# Digit runs long enough to be an integer that doesn't fit in 64 bits
+_WIDE_INT_RE = re.compile(rb'\d{19,}')
+
+def _loads(data: bytes) -> Any:
+    """Parse a JSON document, using orjson when it is installed and can parse it exactly"""
+    # orjson silently parses integers wider than 64 bits as floats (e.g. wei amounts), so use
+    # the stdlib parser, which keeps them exact, whenever the document may contain one
+    if orjson is not None and _WIDE_INT_RE.search(data) is None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 class ContractSyncer:
     def __init__(self) -> None:
@@ -32,80 +70,402 @@ class ContractSyncer:
         self.typechain_target = self.frontend_dir / "src" / "contracts" / "typechain-types"
         self.contracts_data_ts = self.frontend_dir / "src" / "config" / "contracts-data.ts"
         
+        # Hash of the contracts.json that contracts-data.ts was last generated from, plus the
+        # size/mtime of the file written, so edits or checkouts of the output are detected
+        self.contracts_data_hash = self.contracts_data_ts.with_suffix(".ts.srchash")
+        
+        # Digest of the last synced typechain source tree (plus per-file manifest)
+        self.typechain_digest = self.typechain_target.parent / ".typechain-digest"
+        
+        # Deployed contracts / available tokens per network, filled in by process_contracts_data
+        self._summary_index: Optional[Dict[str, Dict[str, List[str]]]] = None
+        
+        # Output lines, buffered per thread and written to stdout in one call by _flush_log
+        self._local = threading.local()
+        
+    @property
+    def _log(self) -> List[str]:
+        """Output lines buffered by the current thread"""
+        lines = getattr(self._local, "lines", None)
+        if lines is None:
+            lines = self._local.lines = []
+        return lines
+    
+    def _run_step(self, step: Callable[..., bool], *args: Any) -> Tuple[bool, List[str]]:
+        """Run a sync step on a worker thread, returning its result and the lines it logged"""
+        self._local.lines = []
+        return step(*args), self._log
+    
+    def _flush_log(self) -> None:
+        """Write all buffered output lines to stdout at once"""
+        if self._log:
+            sys.stdout.write('\n'.join(self._log) + '\n')
+            sys.stdout.flush()
+            self._log.clear()
+    
     def validate_directories(self) -> bool:
         """Validate that required directories exist"""
-        missing_dirs = []
-        
-        if not self.lending_dir.exists():
-            missing_dirs.append(str(self.lending_dir))
-        if not self.typechain_source.exists():
-            missing_dirs.append(str(self.typechain_source))
-        if not self.contracts_json.exists():
-            missing_dirs.append(str(self.contracts_json))
-        if not self.frontend_dir.exists():
-            missing_dirs.append(str(self.frontend_dir))
+        # List lending-zeta once and check its required children against that listing
+        try:
+            with os.scandir(self.lending_dir) as entries:
+                lending_entries = {entry.name for entry in entries}
+        except OSError:
+            lending_entries = None
+        
+        checks = [
+            (self.lending_dir, lending_entries is not None),
+            (self.typechain_source, lending_entries is not None and self.typechain_source.name in lending_entries),
+            (self.contracts_json, lending_entries is not None and self.contracts_json.name in lending_entries),
+            (self.frontend_dir, self.frontend_dir.exists()),
+        ]
+        missing_dirs = [str(path) for path, present in checks if not present]
             
         if missing_dirs:
-            print("❌ Error: Missing required directories/files:")
+            self._log.append("❌ Error: Missing required directories/files:")
             for dir_path in missing_dirs:
-                print(f"   - {dir_path}")
+                self._log.append(f"   - {dir_path}")
             return False
             
         return True
         
+    def _hash_file(self, path: str) -> str:
+        """Hash the contents of a single file"""
+        h = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                h.update(chunk)
+        return h.hexdigest()
+    
+    def _compute_tree_digest(self, root: Path, cached_files: Dict[str, List[Any]]) -> Tuple[str, Dict[str, List[Any]]]:
+        """Compute an aggregate digest of every file under root.
+        
+        Files whose size and mtime match the cached manifest reuse their cached
+        content hash; only new or touched files are re-read and hashed.
+        Returns the hex digest and the refreshed manifest.
+        """
+        files: Dict[str, List[Any]] = {}
+        stack = [str(root)]
+        
+        while stack:
+            current = stack.pop()
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    # Follow directory symlinks, matching what the copy does
+                    if entry.is_dir():
+                        stack.append(entry.path)
+                        continue
+                    
+                    st = entry.stat()
+                    rel_path = Path(os.path.relpath(entry.path, root)).as_posix()
+                    cached = cached_files.get(rel_path)
+                    # Only trust well-formed [size, mtime_ns, hash] entries; rehash anything else
+                    if (isinstance(cached, list) and len(cached) == 3 and isinstance(cached[2], str)
+                            and cached[0] == st.st_size and cached[1] == st.st_mtime_ns):
+                        file_hash = cached[2]
+                    else:
+                        file_hash = self._hash_file(entry.path)
+                    files[rel_path] = [st.st_size, st.st_mtime_ns, file_hash]
+        
+        tree_hash = hashlib.blake2b(digest_size=16)
+        for rel_path in sorted(files):
+            tree_hash.update(f"{rel_path}\0{files[rel_path][2]}\n".encode('utf-8'))
+        
+        return tree_hash.hexdigest(), files
+    
+    def _stat_tree(self, root: Path) -> Optional[Dict[str, List[int]]]:
+        """Map every file under root to its [size, mtime_ns], or None if root can't be read"""
+        files: Dict[str, List[int]] = {}
+        stack = [str(root)]
+        
+        try:
+            while stack:
+                current = stack.pop()
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            stack.append(entry.path)
+                            continue
+                        st = entry.stat()
+                        files[Path(os.path.relpath(entry.path, root)).as_posix()] = [st.st_size, st.st_mtime_ns]
+        except OSError:
+            return None
+        
+        return files
+    
+    def _read_typechain_digest(self) -> Dict[str, Any]:
+        """Read the stored typechain digest, or an empty record if missing/corrupt"""
+        try:
+            with open(self.typechain_digest, 'r') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return stored if isinstance(stored, dict) else {}
+    
+    def _write_typechain_digest(self, digest: str, files: Dict[str, List[Any]],
+                                target_files: Optional[Dict[str, List[int]]]) -> None:
+        """Persist the typechain digest, the source manifest and the synced target's file stats"""
+        self.typechain_digest.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.typechain_digest, 'w') as f:
+            json.dump({"digest": digest, "files": files, "target": target_files}, f)
+    
+    def _tree_has_symlinks(self, root: Path) -> bool:
+        """Check whether any entry under root is a symlink"""
+        stack = [str(root)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_symlink():
+                        return True
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        return False
+    
+    def _clonefile_tree(self, src: Path, dst: Path) -> bool:
+        """Clone a directory tree with clonefile(2) (APFS copy-on-write)"""
+        # clonefile copies symlinks as links; leave trees containing them to the
+        # portable copy, which dereferences them like shutil.copytree
+        if self._tree_has_symlinks(src):
+            return False
+        
+        try:
+            libc = ctypes.CDLL("libSystem.dylib", use_errno=True)
+            libc.clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+            libc.clonefile.restype = ctypes.c_int
+            return libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+        except (OSError, AttributeError):
+            return False
+    
+    def _reflink_copy_tree(self, src: Path, dst: Path) -> bool:
+        """Copy a directory tree with cp --reflink=auto (reflinks on btrfs/XFS/bcachefs)
+
+        -L dereferences symlinks, matching shutil.copytree.
+        """
+        dst.mkdir(parents=True, exist_ok=True)
+        try:
+            result = subprocess.run(
+                ["cp", "-aL", "--reflink=auto", f"{src}/.", str(dst)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            return False
+        return result.returncode == 0
+    
+    def _robocopy_tree(self, src: Path, dst: Path) -> bool:
+        """Copy a directory tree with multi-threaded robocopy"""
+        try:
+            result = subprocess.run(
+                ["robocopy", str(src), str(dst), "/MIR", "/NDL", "/NFL", "/NJH", "/NJS", "/MT:16"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            return False
+        # robocopy exit codes 0-7 indicate success; 8 and above indicate failures
+        return result.returncode <= 7
+    
+    def _zero_copy_file(self, src: str, dst: str) -> None:
+        """Copy a single file's data without round-tripping it through userspace"""
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            if sys.platform == "darwin" and hasattr(shutil, "_fastcopy_fcopyfile"):
+                import posix
+                try:
+                    shutil._fastcopy_fcopyfile(fsrc, fdst, posix._COPYFILE_DATA)
+                    return
+                except shutil._GiveupOnFastCopy:
+                    # fcopyfile can't handle this file; copy through userspace like shutil.copyfile does
+                    fsrc.seek(0)
+                    fdst.seek(0)
+                    fdst.truncate()
+                    shutil.copyfileobj(fsrc, fdst)
+                    return
+            
+            src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+            size = os.fstat(src_fd).st_size
+            offset = 0
+            
+            # copy_file_range keeps data in the kernel and can reflink on btrfs/XFS
+            if hasattr(os, "copy_file_range"):
+                try:
+                    while True:
+                        copied = os.copy_file_range(src_fd, dst_fd, 1 << 30)
+                        if copied == 0:
+                            break
+                        offset += copied
+                except OSError as e:
+                    if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                        raise
+                # Some filesystems return 0 before EOF (procfs-style files, some cross-fs
+                # copies), so only trust it once the whole file has been copied
+                if 0 < size <= offset:
+                    return
+            
+            # Continue with sendfile from wherever copy_file_range stopped
+            if hasattr(os, "sendfile") and offset < size:
+                try:
+                    while offset < size:
+                        sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                except OSError as e:
+                    if e.errno not in (errno.ENOSYS, errno.EINVAL, errno.ENOTSOCK):
+                        raise
+                if offset >= size:
+                    return
+            
+            # Read/write whatever is left, up to the real EOF
+            fsrc.seek(offset)
+            fdst.seek(offset)
+            shutil.copyfileobj(fsrc, fdst)
+    
+    def _parallel_copytree(self, src: Path, dst: Path) -> None:
+        """Copy a directory tree, copying files concurrently on a thread pool"""
+        dir_pairs: List[Tuple[str, str]] = []
+        file_pairs: List[Tuple[str, str]] = []
+        
+        # Recreate the directory skeleton serially and collect the files to copy
+        for dir_path, _, file_names in os.walk(src, followlinks=True):
+            target_dir = os.path.join(dst, os.path.relpath(dir_path, src))
+            os.makedirs(target_dir, exist_ok=True)
+            dir_pairs.append((dir_path, target_dir))
+            for name in file_names:
+                file_pairs.append((os.path.join(dir_path, name), os.path.join(target_dir, name)))
+        
+        # File copies release the GIL in their syscalls, so threads overlap the I/O
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for _ in executor.map(lambda pair: self._zero_copy_file(*pair), file_pairs):
+                pass
+        
+        # Preserve metadata; directories last (deepest first) so copying files doesn't bump their mtimes
+        for src_file, dst_file in file_pairs:
+            shutil.copystat(src_file, dst_file)
+        for src_dir, dst_dir in reversed(dir_pairs):
+            shutil.copystat(src_dir, dst_dir)
+    
+    def _fast_copytree(self, src: Path, dst: Path) -> None:
+        """Copy a directory tree using the fastest primitive available on this platform"""
+        if sys.platform == "darwin":
+            copied = self._clonefile_tree(src, dst)
+        elif sys.platform.startswith("linux"):
+            copied = self._reflink_copy_tree(src, dst)
+        elif sys.platform == "win32":
+            copied = self._robocopy_tree(src, dst)
+        else:
+            copied = False
+        
+        if copied:
+            return
+        
+        # Fall back to a portable copy, discarding anything a failed native copy left behind
+        if dst.exists():
+            shutil.rmtree(dst)
+        self._parallel_copytree(src, dst)
+    
     def sync_typechains(self) -> bool:
         """Sync typechain-types from lending-zeta to frontend"""
-        print("🔄 Syncing typechain types...")
+        self._log.append("🔄 Syncing typechain types...")
         
         try:
-            # Remove existing typechain directory if it exists
+            # Skip the copy entirely if the source tree hasn't changed since the last sync
+            stored = self._read_typechain_digest()
+            cached_files = stored.get("files")
+            if not isinstance(cached_files, dict):
+                cached_files = {}
+            digest, files = self._compute_tree_digest(self.typechain_source, cached_files)
+            
+            # The target must also be exactly as we left it (no edits, deletions or checkouts)
+            target_files = self._stat_tree(self.typechain_target) if stored.get("digest") == digest else None
+            if target_files is not None and target_files == stored.get("target"):
+                if files != cached_files:
+                    # Contents unchanged but mtimes moved; refresh manifest for the fast path
+                    self._write_typechain_digest(digest, files, target_files)
+                self._log.append("   ✅ Typechain types unchanged, skipping copy")
+                return True
+            
+            # Remove existing typechain directory if it exists. The native copy
+            # backends don't delete stale files (and clonefile requires that the
+            # destination doesn't exist), so this is still needed on every platform.
             if self.typechain_target.exists():
                 shutil.rmtree(self.typechain_target)
-                print(f"   ✅ Removed existing {self.typechain_target}")
+                self._log.append(f"   ✅ Removed existing {self.typechain_target}")
             
             # Copy typechain-types directory
-            shutil.copytree(self.typechain_source, self.typechain_target)
-            print(f"   ✅ Copied typechain types to {self.typechain_target}")
+            self._fast_copytree(self.typechain_source, self.typechain_target)
+            self._log.append(f"   ✅ Copied typechain types to {self.typechain_target}")
+            
+            self._write_typechain_digest(digest, files, self._stat_tree(self.typechain_target))
             
             return True
             
         except Exception as e:
-            print(f"   ❌ Error syncing typechains: {e}")
+            self._log.append(f"   ❌ Error syncing typechains: {e}")
             return False
     
-    def process_contracts_data(self, contracts_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process contracts data to flatten token structure for frontend compatibility"""
-        processed_data = contracts_data.copy()
-        
-        # Process each network to flatten token structure
-        if "networks" in processed_data:
-            for chain_id, network in processed_data["networks"].items():
-                if "tokens" in network:
-                    flattened_tokens = {}
-                    for symbol, token_data in network["tokens"].items():
-                        # If token_data is a dict with address, flatten to just the address
-                        if isinstance(token_data, dict) and "address" in token_data:
-                            flattened_tokens[symbol] = token_data["address"]
-                        else:
-                            # Keep as-is if already a string
-                            flattened_tokens[symbol] = token_data
-                    
-                    # Update the network with flattened tokens
-                    processed_data["networks"][chain_id]["tokens"] = flattened_tokens
+    def process_contracts_data(self, contracts_data: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Dict[str, List[str]]]]:
+        """Process contracts data to flatten token structure for frontend compatibility.
+        
+        Returns new top-level and network dicts (the input is left untouched), plus a
+        per-network index of deployed contracts and available tokens for the summary,
+        built in the same pass.
+        """
+        if "networks" not in contracts_data:
+            return dict(contracts_data), {}
         
-        return processed_data
+        networks = {}
+        summary_index: Dict[str, Dict[str, List[str]]] = {}
+        for chain_id, network in contracts_data["networks"].items():
+            tokens = {}
+            available_tokens = []
+            for symbol, token_data in network.get("tokens", {}).items():
+                # Flatten {"address": ..., ...} token entries to just the address; keep strings as-is
+                if isinstance(token_data, dict) and "address" in token_data:
+                    token_data = token_data["address"]
+                tokens[symbol] = token_data
+                if token_data and not isinstance(token_data, dict) and token_data != ZERO_ADDR:
+                    available_tokens.append(symbol)
+            
+            if "tokens" in network:
+                network = {**network, "tokens": tokens}
+            networks[chain_id] = network
+            
+            summary_index[chain_id] = {
+                "deployed_contracts": [name for name, addr in network.get("contracts", {}).items()
+                                       if addr and addr != ZERO_ADDR],
+                "available_tokens": available_tokens,
+            }
+        
+        return {**contracts_data, "networks": networks}, summary_index
     
-    def convert_contracts_json_to_data_ts(self) -> bool:
+    def convert_contracts_json_to_data_ts(self, contracts_data: Dict[str, Any], raw_bytes: bytes) -> bool:
         """Convert contracts.json to contracts-data.ts format"""
-        print("🔄 Converting contracts.json to contracts-data.ts...")
+        self._log.append("🔄 Converting contracts.json to contracts-data.ts...")
+        
+        tmp_path = self.contracts_data_ts.with_suffix(".ts.tmp")
+        hash_tmp = self.contracts_data_hash.with_suffix(".srchash.tmp")
         
         try:
-            # Read contracts.json
-            with open(self.contracts_json, 'r') as f:
-                contracts_data = json.load(f)
+            # Skip regeneration if contracts.json is unchanged since the last run and
+            # contracts-data.ts is still the file that run wrote
+            source_hash_obj = hashlib.blake2b(raw_bytes, digest_size=16)
+            source_hash_obj.update(DATA_TS_FORMAT_VERSION.encode('utf-8'))
+            source_hash = source_hash_obj.hexdigest()
+            try:
+                with open(self.contracts_data_hash, 'r') as f:
+                    stored = json.load(f)
+                output_stat = self.contracts_data_ts.stat()
+            except (OSError, ValueError):
+                stored = None
+            if (isinstance(stored, dict)
+                    and stored.get("source") == source_hash
+                    and stored.get("size") == output_stat.st_size
+                    and stored.get("mtime_ns") == output_stat.st_mtime_ns):
+                self._log.append(f"   ✅ {self.contracts_json.name} unchanged, skipping {self.contracts_data_ts.name}")
+                return True
             
             # Process contracts data to flatten token structure for frontend compatibility
-            processed_data = self.process_contracts_data(contracts_data)
+            processed_data, self._summary_index = self.process_contracts_data(contracts_data)
             
             # Generate TypeScript content for data only
             ts_content = self.generate_contracts_data_ts(processed_data)
@@ -114,69 +474,51 @@ class ContractSyncer:
             config_dir = self.contracts_data_ts.parent
             config_dir.mkdir(parents=True, exist_ok=True)
             
-            # Write to contracts-data.ts
-            with open(self.contracts_data_ts, 'w') as f:
-                f.write(ts_content)
+            # Write to contracts-data.ts atomically so an interrupted run never leaves a partial file
+            data = ts_content.encode('utf-8')
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, self.contracts_data_ts)
+            
+            # Record the source hash only after the TS file is fully written
+            output_stat = self.contracts_data_ts.stat()
+            hash_tmp.write_text(json.dumps({
+                "source": source_hash,
+                "size": output_stat.st_size,
+                "mtime_ns": output_stat.st_mtime_ns,
+            }))
+            os.replace(hash_tmp, self.contracts_data_hash)
                 
-            print(f"   ✅ Updated {self.contracts_data_ts}")
+            self._log.append(f"   ✅ Updated {self.contracts_data_ts}")
             return True
             
         except Exception as e:
-            print(f"   ❌ Error converting contracts.json: {e}")
-            return False
-
-    def should_quote_key(self, key: Union[str, int]) -> bool:
-        """Determine if a key should be quoted in TypeScript"""
-        # Convert to string for checking
-        key_str = str(key)
-        
-        # Check if it's a valid JavaScript identifier
-        # Valid identifiers: start with letter, $, or _, followed by letters, digits, $, or _
-        js_identifier_pattern = r'^[a-zA-Z_$][a-zA-Z0-9_$]*$'
-        
-        # Check if it's a valid numeric key (pure numbers are valid unquoted)
-        if key_str.isdigit():
-            return False
+            self._log.append(f"   ❌ Error converting contracts.json: {e}")
             
-        # Check if it's a valid identifier
-        if re.match(js_identifier_pattern, key_str):
+            # Don't leave temp files behind
+            for leftover in (tmp_path, hash_tmp):
+                try:
+                    leftover.unlink(missing_ok=True)
+                except OSError:
+                    pass
             return False
-            
-        # If it contains special characters or doesn't match identifier pattern, quote it
-        return True
-    
+
     def generate_contracts_data_ts(self, contracts_data: Dict[str, Any]) -> str:
         """Generate TypeScript content for contracts-data.ts (data only)"""
         
-        # Convert Python dict to TypeScript object format
-        def dict_to_ts_object(obj: Any, indent: int = 0) -> str:
-            if isinstance(obj, dict):
-                lines = ["{"]
-                for key, value in obj.items():
-                    # Only quote keys that need quoting (special characters, reserved words, etc.)
-                    if self.should_quote_key(key):
-                        quoted_key = f'"{key}"'
-                    else:
-                        quoted_key = str(key)
-                    
-                    ts_value = dict_to_ts_object(value, indent + 2)
-                    type_annotation = ""
-                    
-                    # Add type annotation for specific keys
-                    if key == "type" and isinstance(value, str):
-                        type_annotation = " as const"
-                    
-                    lines.append(f"{'  ' * (indent + 1)}{quoted_key}: {ts_value}{type_annotation},")
-                lines.append(f"{'  ' * indent}}}")
-                return '\n'.join(lines)
-            elif isinstance(obj, str):
-                return f'"{obj}"'
-            elif isinstance(obj, (int, float)):
-                return str(obj)
-            else:
-                return f'"{str(obj)}"'
-        
-        contracts_ts_obj = dict_to_ts_object(contracts_data)
+        # TS object literal syntax is a superset of JSON: serialize with the C-accelerated
+        # encoder, then unquote keys that are valid identifiers or numbers
+        contracts_ts_obj = json.dumps(contracts_data, indent=2, ensure_ascii=False)
+        contracts_ts_obj = _IDENT_KEY_RE.sub(r'\1\2:', contracts_ts_obj)
+        
+        # Narrow network types to literals
+        contracts_ts_obj = _TYPE_CONST_RE.sub(r'\1 as const', contracts_ts_obj)
         
         # Generate timestamp for when this was generated
         timestamp = datetime.now().isoformat()
@@ -192,53 +534,54 @@ export const contractsData = {contracts_ts_obj};
     
     def print_summary(self, contracts_data: Dict[str, Any]) -> None:
         """Print a summary of the sync operation"""
-        print("\n📋 Sync Summary:")
-        print("=" * 50)
+        # Skip the detailed summary when nobody is watching (e.g. CI piping to a log)
+        # unless SYNC_VERBOSE is set
+        if not (sys.stdout.isatty() or os.getenv("SYNC_VERBOSE")):
+            self._log.append("sync OK")
+            return
+        
+        self._log.append("\n📋 Sync Summary:")
+        self._log.append("=" * 50)
         
         # Deployment info
         if "deployments" in contracts_data:
             deployment_info = contracts_data["deployments"]
-            print(f"Last Updated: {deployment_info.get('lastUpdated', 'Unknown')}")
-            print(f"Deployer: {deployment_info.get('deployer', 'Unknown')}")
+            self._log.append(f"Last Updated: {deployment_info.get('lastUpdated', 'Unknown')}")
+            self._log.append(f"Deployer: {deployment_info.get('deployer', 'Unknown')}")
         
         # Network summary
         if "networks" in contracts_data:
+            summary_index = self._summary_index
+            if summary_index is None:
+                # Conversion was skipped (contracts.json unchanged), so build the index here
+                _, summary_index = self.process_contracts_data(contracts_data)
+            
             for chain_id, network in contracts_data["networks"].items():
-                print(f"\n🌐 {network.get('name', 'Unknown')} (Chain ID: {chain_id}):")
+                self._log.append(f"\n🌐 {network.get('name', 'Unknown')} (Chain ID: {chain_id}):")
                 
                 # Explorer URL
                 if network.get("explorer"):
-                    print(f"   🔗 Explorer: {network['explorer']}")
+                    self._log.append(f"   🔗 Explorer: {network['explorer']}")
                 
                 # RPC URL
                 if network.get("rpc"):
-                    print(f"   🌐 RPC: {network['rpc']}")
+                    self._log.append(f"   🌐 RPC: {network['rpc']}")
+                
+                network_summary = summary_index.get(chain_id, {})
                 
                 # Deployed contracts
-                contracts = network.get("contracts", {})
-                deployed_contracts = [name for name, addr in contracts.items() 
-                                    if addr and addr != "0x0000000000000000000000000000000000000000"]
+                deployed_contracts = network_summary.get("deployed_contracts", [])
                 if deployed_contracts:
-                    print(f"   📄 Deployed Contracts: {', '.join(deployed_contracts)}")
+                    self._log.append(f"   📄 Deployed Contracts: {', '.join(deployed_contracts)}")
                 
                 # Available tokens
-                tokens = network.get("tokens", {})
-                available_tokens = []
-                for symbol, token_data in tokens.items():
-                    # Handle both old format (string) and new format (object with address)
-                    if isinstance(token_data, dict):
-                        addr = token_data.get("address", "")
-                    else:
-                        addr = token_data
-                    
-                    if addr and addr != "0x0000000000000000000000000000000000000000":
-                        available_tokens.append(symbol)
+                available_tokens = network_summary.get("available_tokens", [])
                 if available_tokens:
-                    print(f"   🪙 Available Tokens: {', '.join(available_tokens)}")
+                    self._log.append(f"   🪙 Available Tokens: {', '.join(available_tokens)}")
 
-        print("\n📁 Generated Files:")
-        print(f"   - {self.contracts_data_ts}")
-        print(f"   - {self.typechain_target}")
+        self._log.append("\n📁 Generated Files:")
+        self._log.append(f"   - {self.contracts_data_ts}")
+        self._log.append(f"   - {self.typechain_target}")
     
     def run(self) -> None:
         """Main sync process"""
@@ -247,30 +590,43 @@ export const contractsData = {contracts_ts_obj};
         
         # Validate directories
         if not self.validate_directories():
+            self._flush_log()
             sys.exit(1)
         
-        # Load contracts.json for summary
+        # Read and parse contracts.json once; the conversion and the summary share it
         try:
-            with open(self.contracts_json, 'r') as f:
-                contracts_data: Dict[str, Any] = json.load(f)
+            raw_contracts = self.contracts_json.read_bytes()
+            contracts_data: Dict[str, Any] = _loads(raw_contracts)
         except Exception as e:
             print(f"❌ Error reading contracts.json: {e}")
             sys.exit(1)
         
-        # Perform sync operations
+        # Perform sync operations. They touch disjoint outputs, so the typechain copy (I/O-bound)
+        # runs alongside the contracts-data.ts conversion; each step buffers its own output.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # 1. Sync typechains
+            typechain_step = executor.submit(self._run_step, self.sync_typechains)
+            
+            # 2. Convert contracts.json to contracts-data.ts
+            contracts_step = executor.submit(
+                self._run_step, self.convert_contracts_json_to_data_ts, contracts_data, raw_contracts
+            )
+            
+            step_results = [typechain_step.result(), contracts_step.result()]
+        
+        # Emit step output in a fixed order regardless of which step finished first
         success = True
+        for step_ok, step_lines in step_results:
+            self._log.extend(step_lines)
+            if not step_ok:
+                success = False
         
-        # 1. Sync typechains
-        if not self.sync_typechains():
-            success = False
-            
-        # 2. Convert contracts.json to contracts-data.ts
-        if not self.convert_contracts_json_to_data_ts():
-            success = False
+        self._flush_log()
         
         if success:
             print("\n✅ All sync operations completed successfully!")
             self.print_summary(contracts_data)
+            self._flush_log()
         else:
             print("\n❌ Some sync operations failed. Please check the errors above.")
             sys.exit(1)